@@ -1468,8 +1468,7 @@ class CmdStanGQ:
             'Property "generated_quantities" has been deprecated, '
             'use method "draws" instead.'
         )
-        if self._draws.size == 0:
-            self._assemble_generated_quantities()
+        self._assemble_generated_quantities()
         return flatten_chains(self._draws)
 
     @property
@@ -1481,8 +1480,7 @@ class CmdStanGQ:
             'Property "generated_quantities_pd" has been deprecated, '
             'use method "draws_pd" instead.'
         )
-        if self._draws.size == 0:
-            self._assemble_generated_quantities()
+        self._assemble_generated_quantities()
         return pd.DataFrame(
             data=flatten_chains(self._draws),
             columns=self.column_names,
@@ -1534,8 +1532,7 @@ class CmdStanGQ:
         CmdStanGQ.draws_xr
         CmdStanMCMC.draws
         """
-        if self._draws.size == 0:
-            self._assemble_generated_quantities()
+        self._assemble_generated_quantities()
         if (
             inc_warmup
             and not self.mcmc_sample.metadata.cmdstan_config['save_warmup']
@@ -1887,6 +1884,8 @@ class CmdStanGQ:
         return result
 
     def _assemble_generated_quantities(self) -> None:
+        if self._draws.shape != (0,):
+            return
         # use numpy genfromtext
         warmup = self.mcmc_sample.metadata.cmdstan_config['save_warmup']
         num_draws = self.mcmc_sample.draws(inc_warmup=warmup).shape[0]
@@ -5,7 +5,6 @@ import json
 import logging
 import os
 import unittest
-from importlib import reload
 
 import numpy as np
 import pandas as pd
@@ -21,14 +20,61 @@ DATAFILES_PATH = os.path.join(HERE, 'data')
 
 
 @contextlib.contextmanager
-def without_import(library, module):
-    with unittest.mock.patch.dict('sys.modules', {library: None}):
-        reload(module)
-        yield
-    reload(module)
+def without_xarray():
+    # flip the availability flag rather than reloading cmdstanpy.stanfit
+    with unittest.mock.patch.dict('sys.modules', {'xarray': None}):
+        with unittest.mock.patch.object(
+            cmdstanpy.stanfit, 'XARRAY_INSTALLED', False
+        ):
+            yield
 
 
 class GenerateQuantitiesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._bern_model = CmdStanModel(
+            stan_file=os.path.join(DATAFILES_PATH, 'bernoulli.stan')
+        )
+        cls._bern_ppc_model = CmdStanModel(
+            stan_file=os.path.join(DATAFILES_PATH, 'bernoulli_ppc.stan')
+        )
+        cls._bern_ppc_dup_model = CmdStanModel(
+            stan_file=os.path.join(DATAFILES_PATH, 'bernoulli_ppc_dup.stan')
+        )
+        # sampler fits are cached on first use by _sample_cached
+        cls._fits = {}
+
+    @classmethod
+    def _sample_cached(
+        cls,
+        model,
+        chains=4,
+        iter_warmup=None,
+        iter_sampling=100,
+        save_warmup=False,
+        seed=12345,
+    ):
+        key = (
+            model.stan_file,
+            chains,
+            iter_warmup,
+            iter_sampling,
+            save_warmup,
+            seed,
+        )
+        if key not in cls._fits:
+            jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
+            cls._fits[key] = model.sample(
+                data=jdata,
+                chains=chains,
+                parallel_chains=2,
+                seed=seed,
+                iter_warmup=iter_warmup,
+                iter_sampling=iter_sampling,
+                save_warmup=save_warmup,
+            )
+        return cls._fits[key]
+
     def test_from_csv_files(self):
         # fitted_params sample - list of filenames
         goodfiles_path = os.path.join(DATAFILES_PATH, 'runset-good', 'bern')
@@ -37,8 +83,7 @@ class GenerateQuantitiesTest(unittest.TestCase):
             csv_files.append('{}-{}.csv'.format(goodfiles_path, i + 1))
 
         # gq_model
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli_ppc.stan')
-        model = CmdStanModel(stan_file=stan)
+        model = self._bern_ppc_model
         jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
 
         bern_gqs = model.generate_quantities(data=jdata, mcmc_sample=csv_files)
@@ -91,10 +136,29 @@ class GenerateQuantitiesTest(unittest.TestCase):
             + bern_gqs.draws_pd().shape[1],
         )
 
+    def test_draws_assembled_once(self):
+        goodfiles_path = os.path.join(DATAFILES_PATH, 'runset-good', 'bern')
+        csv_files = []
+        for i in range(4):
+            csv_files.append('{}-{}.csv'.format(goodfiles_path, i + 1))
+
+        model = self._bern_ppc_model
+        jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
+
+        bern_gqs = model.generate_quantities(data=jdata, mcmc_sample=csv_files)
+        with unittest.mock.patch(
+            'numpy.loadtxt', wraps=np.loadtxt
+        ) as mock_loadtxt:
+            bern_gqs.draws_pd()
+            bern_gqs.draws_pd(vars='y_rep')
+            bern_gqs.draws()
+            bern_gqs.stan_variable(var='y_rep')
+            bern_gqs.stan_variables()
+        self.assertEqual(mock_loadtxt.call_count, bern_gqs.chains)
+
     def test_from_csv_files_bad(self):
         # gq model
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli_ppc.stan')
-        model = CmdStanModel(stan_file=stan)
+        model = self._bern_ppc_model
         jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
 
         # no filename
@@ -116,19 +180,10 @@ class GenerateQuantitiesTest(unittest.TestCase):
 
     def test_from_mcmc_sample(self):
         # fitted_params sample
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli.stan')
-        bern_model = CmdStanModel(stan_file=stan)
         jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
-        bern_fit = bern_model.sample(
-            data=jdata,
-            chains=4,
-            parallel_chains=2,
-            seed=12345,
-            iter_sampling=100,
-        )
+        bern_fit = self._sample_cached(self._bern_model)
         # gq_model
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli_ppc.stan')
-        model = CmdStanModel(stan_file=stan)
+        model = self._bern_ppc_model
 
         bern_gqs = model.generate_quantities(data=jdata, mcmc_sample=bern_fit)
 
@@ -144,18 +199,9 @@ class GenerateQuantitiesTest(unittest.TestCase):
             self.assertTrue(os.path.exists(csv_file))
 
     def test_from_mcmc_sample_draws(self):
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli.stan')
-        bern_model = CmdStanModel(stan_file=stan)
         jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
-        bern_fit = bern_model.sample(
-            data=jdata,
-            chains=4,
-            parallel_chains=2,
-            seed=12345,
-            iter_sampling=100,
-        )
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli_ppc.stan')
-        model = CmdStanModel(stan_file=stan)
+        bern_fit = self._sample_cached(self._bern_model)
+        model = self._bern_ppc_model
 
         bern_gqs = model.generate_quantities(data=jdata, mcmc_sample=bern_fit)
 
@@ -195,18 +241,9 @@ class GenerateQuantitiesTest(unittest.TestCase):
         self.assertEqual(xr_data_plus.theta.values.shape, (4, 100))
 
     def test_from_mcmc_sample_variables(self):
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli.stan')
-        bern_model = CmdStanModel(stan_file=stan)
         jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
-        bern_fit = bern_model.sample(
-            data=jdata,
-            chains=4,
-            parallel_chains=2,
-            seed=12345,
-            iter_sampling=100,
-        )
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli_ppc.stan')
-        model = CmdStanModel(stan_file=stan)
+        bern_fit = self._sample_cached(self._bern_model)
+        model = self._bern_ppc_model
 
         bern_gqs = model.generate_quantities(data=jdata, mcmc_sample=bern_fit)
 
@@ -239,21 +276,12 @@ class GenerateQuantitiesTest(unittest.TestCase):
 
     def test_save_warmup(self):
         # fitted_params sample
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli.stan')
-        bern_model = CmdStanModel(stan_file=stan)
         jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
-        bern_fit = bern_model.sample(
-            data=jdata,
-            chains=4,
-            parallel_chains=2,
-            seed=12345,
-            iter_warmup=100,
-            iter_sampling=100,
-            save_warmup=True,
+        bern_fit = self._sample_cached(
+            self._bern_model, iter_warmup=100, save_warmup=True
         )
         # gq_model
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli_ppc.stan')
-        model = CmdStanModel(stan_file=stan)
+        model = self._bern_ppc_model
 
         with LogCapture() as log:
             logging.getLogger()
@@ -268,27 +296,27 @@ class GenerateQuantitiesTest(unittest.TestCase):
                 'generate additional quantities of interest.',
             )
         )
-        self.assertEqual(bern_gqs.draws().shape, (100, 4, 10))
-        self.assertEqual(
-            bern_gqs.draws(concat_chains=False, inc_warmup=False).shape,
-            (100, 4, 10),
-        )
-        self.assertEqual(
-            bern_gqs.draws(concat_chains=False, inc_warmup=True).shape,
-            (200, 4, 10),
-        )
-        self.assertEqual(
-            bern_gqs.draws(concat_chains=True, inc_warmup=False).shape,
-            (400, 10),
-        )
-        self.assertEqual(
-            bern_gqs.draws(concat_chains=True, inc_warmup=True).shape,
-            (800, 10),
-        )
-
-        self.assertEqual(bern_gqs.draws_pd().shape, (400, 10))
-        self.assertEqual(bern_gqs.draws_pd(inc_warmup=False).shape, (400, 10))
-        self.assertEqual(bern_gqs.draws_pd(inc_warmup=True).shape, (800, 10))
+        shapes = {
+            (False, False): (100, 4, 10),
+            (False, True): (200, 4, 10),
+            (True, False): (400, 10),
+            (True, True): (800, 10),
+        }
+        for (concat_chains, inc_warmup), shape in shapes.items():
+            with self.subTest(
+                concat_chains=concat_chains, inc_warmup=inc_warmup
+            ):
+                self.assertEqual(
+                    bern_gqs.draws(
+                        concat_chains=concat_chains, inc_warmup=inc_warmup
+                    ).shape,
+                    shape,
+                )
+
+        full_pd = bern_gqs.draws_pd(inc_warmup=True)
+        self.assertEqual(full_pd.shape, (800, 10))
+        sampling_pd = bern_gqs.draws_pd()
+        self.assertEqual(sampling_pd.shape, (400, 10))
         self.assertEqual(
             bern_gqs.draws_pd(vars=['y_rep'], inc_warmup=False).shape,
             (400, 10),
@@ -339,19 +367,10 @@ class GenerateQuantitiesTest(unittest.TestCase):
 
     def test_sample_plus_quantities_dedup(self):
         # fitted_params - model GQ block: y_rep is PPC of theta
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli_ppc.stan')
-        model = CmdStanModel(stan_file=stan)
         jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
-        bern_fit = model.sample(
-            data=jdata,
-            chains=4,
-            parallel_chains=2,
-            seed=12345,
-            iter_sampling=100,
-        )
+        bern_fit = self._sample_cached(self._bern_ppc_model)
         # gq_model - y_rep[n] == y[n]
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli_ppc_dup.stan')
-        model = CmdStanModel(stan_file=stan)
+        model = self._bern_ppc_dup_model
         bern_gqs = model.generate_quantities(data=jdata, mcmc_sample=bern_fit)
         # check that models have different y_rep values
         assert_raises(
@@ -374,8 +393,7 @@ class GenerateQuantitiesTest(unittest.TestCase):
             csv_files.append('{}-{}.csv'.format(goodfiles_path, i + 1))
 
         # gq_model
-        stan = os.path.join(DATAFILES_PATH, 'bernoulli_ppc.stan')
-        model = CmdStanModel(stan_file=stan)
+        model = self._bern_ppc_model
         jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
 
         bern_gqs = model.generate_quantities(data=jdata, mcmc_sample=csv_files)
@@ -401,23 +419,14 @@ class GenerateQuantitiesTest(unittest.TestCase):
         )
 
     def test_no_xarray(self):
-        with without_import('xarray', cmdstanpy.stanfit):
+        with without_xarray():
             with self.assertRaises(ImportError):
                 # if this fails the testing framework is the problem
                 import xarray as _  # noqa
 
-            stan = os.path.join(DATAFILES_PATH, 'bernoulli.stan')
-            bern_model = CmdStanModel(stan_file=stan)
             jdata = os.path.join(DATAFILES_PATH, 'bernoulli.data.json')
-            bern_fit = bern_model.sample(
-                data=jdata,
-                chains=4,
-                parallel_chains=2,
-                seed=12345,
-                iter_sampling=100,
-            )
-            stan = os.path.join(DATAFILES_PATH, 'bernoulli_ppc.stan')
-            model = CmdStanModel(stan_file=stan)
+            bern_fit = self._sample_cached(self._bern_model)
+            model = self._bern_ppc_model
 
             bern_gqs = model.generate_quantities(
                 data=jdata, mcmc_sample=bern_fit